@@ -0,0 +1,12 @@
+"""
+Shared pytest configuration for the Cortinillas AI test suite.
+
+Run the suite with ``python -m pytest tests/``; test modules are not meant
+to be executed directly. src/ is put on sys.path once by the ``pythonpath``
+setting in pytest.ini.
+"""
+
+# test_deepgram_api.py is a manual diagnostic script that hits the live
+# Deepgram API; keep it out of regular test collection.
+collect_ignore = ["test_deepgram_api.py"]
+
@@ -8,9 +8,6 @@ import json
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
 
-import sys
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from main import CortinillasAI
 from models import ChannelConfig, DeepgramConfig, APIConfig
 from exceptions import ConfigurationError, AudioExtractionError
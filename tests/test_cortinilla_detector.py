@@ -1,234 +1,325 @@
 """
 Unit tests for the cortinilla detector module.
 """
-import os
-import json
-import tempfile
-import unittest
-from unittest.mock import Mock, patch, mock_open
+from unittest.mock import patch
 from datetime import datetime
 
-from src.cortinilla_detector import CortinillaDetector
+import pytest
+
 from src.models import (
     ChannelConfig, DeepgramConfig, APIConfig, Word, TranscriptionResult,
-    FilteredContent, OverlapResult, Occurrence
+    FilteredContent, OverlapResult
 )
 from src.overlap_detector import OverlapDetector
 
 
-class TestCortinillaDetector(unittest.TestCase):
-    """Test cases for CortinillaDetector class."""
+FIXED_TS = datetime(2024, 1, 1, 12, 0, 0)
+
+_DEMO_WORDS = tuple(Word(*fields) for fields in (
+    ("buenos", 0.0, 0.5, 0.9),
+    ("días", 0.5, 1.0, 0.8),
+    ("y", 1.0, 1.2, 0.7),
+    ("muchas", 1.2, 1.7, 0.9),
+    ("gracias", 1.7, 2.2, 0.8),
+    ("por", 2.2, 2.5, 0.7),
+    ("todo", 2.5, 3.0, 0.8),
+))
+
+_DEMO_TRANSCRIPT = " ".join(word.word for word in _DEMO_WORDS)
+
+_NORM_CASES = (
+    ("Buenos Días", "buenos dias"),
+    ("¡Muchas Gracias!", "muchas gracias"),
+    ("Buenas  Tardes", "buenas tardes"),
+    ("HASTA MAÑANA", "hasta manana"),
+    ("Café con Leche", "cafe con leche"),
+)
+
+_TOKEN_CASES = (
+    ("buenos días", ["buenos", "dias"]),
+    ("¡Muchas Gracias!", ["muchas", "gracias"]),
+    ("", []),
+    ("   ", []),
+    ("single", ["single"]),
+)
+
+_MIME_CASES = (
+    "test.mp3",
+    "test.wav",
+    "test.unknown",  # fallback
+)
+
+
+class _Resp:
+    """Fake Deepgram HTTP response."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.deepgram_config = DeepgramConfig(
-            language="es",
-            model="nova-3",
-            smart_format=True
-        )
-        
-        self.api_config = APIConfig(
-            base_url="http://test.com",
-            cookie_sid="test_sid",
-            format=11,
-            video_is_public=0,
-            is_masive=1,
-            max_retries=3,
-            sleep_seconds=30
-        )
-        
-        self.channel_config = ChannelConfig(
-            channel_name="Test Channel",
-            idemisora=1,
-            idprograma=5,
-            cortinillas=["buenos días", "buenas tardes", "muchas gracias"],
-            deepgram_config=self.deepgram_config,
-            api_config=self.api_config
-        )
-        
-        self.mock_overlap_detector = Mock(spec=OverlapDetector)
-        self.detector = CortinillaDetector(overlap_detector=self.mock_overlap_detector)
+    __slots__ = ("status_code", "text", "_json")
+    
+    def __init__(self, status_code, payload=None, text=""):
+        self.status_code = status_code
+        self.text = text
+        self._json = payload
     
-    def test_init_with_overlap_detector(self):
+    def json(self):
+        return self._json
+
+
+_SERVER_ERROR = _Resp(500, text="Internal Server Error")
+
+_GREETING_OK = _Resp(200, {
+    "results": {
+        "channels": [{
+            "alternatives": [{
+                "transcript": "buenos días muchas gracias",
+                "words": [
+                    {"word": "buenos", "start": 0.0, "end": 0.5, "confidence": 0.9},
+                    {"word": "días", "start": 0.5, "end": 1.0, "confidence": 0.8},
+                    {"word": "muchas", "start": 1.0, "end": 1.5, "confidence": 0.9},
+                    {"word": "gracias", "start": 1.5, "end": 2.0, "confidence": 0.8},
+                ]
+            }]
+        }]
+    },
+    "metadata": {"duration": 2.0}
+})
+
+_SHORT_OK = _Resp(200, {
+    "results": {
+        "channels": [{
+            "alternatives": [{
+                "transcript": "test transcript",
+                "words": []
+            }]
+        }]
+    },
+    "metadata": {"duration": 1.0}
+})
+
+# (responses, expected error, expected call count, expected transcript,
+#  expected (word count, duration) of the result or None to skip those checks)
+_TRANSCRIBE_CASES = (
+    pytest.param(
+        [_GREETING_OK], None, 1, "buenos días muchas gracias", (4, 2.0),
+        id="success"
+    ),
+    pytest.param(
+        [_SERVER_ERROR, _SERVER_ERROR, _SHORT_OK], None, 3, "test transcript", None,
+        id="api_error_with_retry"
+    ),
+    pytest.param(
+        [_SERVER_ERROR] * 3, "Deepgram API error 500", 3, None, None,
+        id="max_retries_exceeded"
+    ),
+)
+
+
+class _StubOverlap:
+    """Minimal stand-in for OverlapDetector that records its calls."""
+    
+    def __init__(self):
+        self.ret = None
+        self.calls = []
+    
+    def process_with_overlap_detection(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self.ret
+
+
+@pytest.fixture(autouse=True)
+def _deepgram_key(monkeypatch):
+    """Provide a fake Deepgram API key to every test."""
+    monkeypatch.setenv("DEEPGRAM_API_KEY", "test_key")
+
+
+@pytest.fixture(scope="module")
+def channel_config():
+    """Create a channel configuration shared by the whole module."""
+    deepgram_config = DeepgramConfig(
+        language="es",
+        model="nova-3",
+        smart_format=True
+    )
+    
+    api_config = APIConfig(
+        base_url="http://test.com",
+        cookie_sid="test_sid",
+        format=11,
+        video_is_public=0,
+        is_masive=1,
+        max_retries=3,
+        sleep_seconds=30
+    )
+    
+    return ChannelConfig(
+        channel_name="Test Channel",
+        idemisora=1,
+        idprograma=5,
+        cortinillas=["buenos días", "buenas tardes", "muchas gracias"],
+        deepgram_config=deepgram_config,
+        api_config=api_config
+    )
+
+
+@pytest.fixture(scope="module")
+def detector_cls():
+    """Import CortinillaDetector lazily so filtered runs skip the import."""
+    from src.cortinilla_detector import CortinillaDetector
+    return CortinillaDetector
+
+
+@pytest.fixture(scope="session")
+def fake_mp3(tmp_path_factory):
+    """Write a fake audio file once and share its path across tests."""
+    path = tmp_path_factory.mktemp("audio") / "fake.mp3"
+    path.write_bytes(b"fake audio data")
+    return str(path)
+
+
+@pytest.fixture(scope="module")
+def detector(detector_cls):
+    """Create one CortinillaDetector for the whole module."""
+    return detector_cls(overlap_detector=_StubOverlap())
+
+
+@pytest.fixture
+def overlap_stub(detector, monkeypatch):
+    """
+    Give the shared detector a fresh stub overlap detector for one test.
+    
+    monkeypatch restores the original afterwards, so preset return values and
+    recorded calls never leak into later tests, whatever order or worker runs them.
+    """
+    stub = _StubOverlap()
+    monkeypatch.setattr(detector, "overlap_detector", stub)
+    return stub
+
+
+class TestCortinillaDetector:
+    """Test cases for CortinillaDetector class."""
+    
+    def test_init_with_overlap_detector(self, detector_cls):
         """Test initialization with overlap detector."""
-        detector = CortinillaDetector(self.mock_overlap_detector)
-        self.assertEqual(detector.overlap_detector, self.mock_overlap_detector)
+        stub = _StubOverlap()
+        detector = detector_cls(stub)
+        assert detector.overlap_detector == stub
     
-    def test_init_without_overlap_detector(self):
+    def test_init_without_overlap_detector(self, detector_cls):
         """Test initialization without overlap detector creates default."""
-        detector = CortinillaDetector()
-        self.assertIsInstance(detector.overlap_detector, OverlapDetector)
+        detector = detector_cls()
+        assert isinstance(detector.overlap_detector, OverlapDetector)
     
-    def test_normalize_text(self):
+    @pytest.mark.parametrize("input_text,expected", _NORM_CASES)
+    def test_normalize_text(self, detector, input_text, expected):
         """Test text normalization."""
-        test_cases = [
-            ("Buenos Días", "buenos dias"),
-            ("¡Muchas Gracias!", "muchas gracias"),
-            ("Buenas  Tardes", "buenas tardes"),
-            ("HASTA MAÑANA", "hasta manana"),
-            ("Café con Leche", "cafe con leche"),
-        ]
-        
-        for input_text, expected in test_cases:
-            with self.subTest(input_text=input_text):
-                result = self.detector._normalize_text(input_text)
-                self.assertEqual(result, expected)
+        assert detector._normalize_text(input_text) == expected
     
-    def test_tokenize(self):
+    @pytest.mark.parametrize("input_text,expected", _TOKEN_CASES)
+    def test_tokenize(self, detector, input_text, expected):
         """Test text tokenization."""
-        test_cases = [
-            ("buenos días", ["buenos", "dias"]),
-            ("¡Muchas Gracias!", ["muchas", "gracias"]),
-            ("", []),
-            ("   ", []),
-            ("single", ["single"]),
-        ]
-        
-        for input_text, expected in test_cases:
-            with self.subTest(input_text=input_text):
-                result = self.detector._tokenize(input_text)
-                self.assertEqual(result, expected)
+        assert detector._tokenize(input_text) == expected
     
-    def test_guess_mime_type(self):
+    @pytest.mark.parametrize("filename", _MIME_CASES)
+    def test_guess_mime_type(self, detector, filename):
         """Test MIME type guessing."""
-        test_cases = [
-            ("test.mp3", "audio/mpeg"),
-            ("test.wav", "audio/wav"),
-            ("test.unknown", "audio/wav"),  # fallback
-        ]
-        
-        for filename, expected in test_cases:
-            with self.subTest(filename=filename):
-                result = self.detector._guess_mime_type(filename)
-                # Note: actual result may vary by system, just check it's reasonable
-                self.assertTrue(result.startswith("audio/"))
+        # Note: actual result may vary by system, just check it's reasonable
+        assert detector._guess_mime_type(filename).startswith("audio/")
     
-    def test_extract_transcript(self):
-        """Test transcript extraction from Deepgram response."""
-        # Valid response
-        valid_response = {
-            "results": {
-                "channels": [{
-                    "alternatives": [{
-                        "transcript": "buenos días muchas gracias"
+    @pytest.mark.parametrize("response,expected", [
+        (
+            {
+                "results": {
+                    "channels": [{
+                        "alternatives": [{
+                            "transcript": "buenos días muchas gracias"
+                        }]
                     }]
-                }]
-            }
-        }
-        
-        result = self.detector._extract_transcript(valid_response)
-        self.assertEqual(result, "buenos días muchas gracias")
-        
-        # Invalid response
-        invalid_response = {"invalid": "structure"}
-        result = self.detector._extract_transcript(invalid_response)
-        self.assertEqual(result, "")
+                }
+            },
+            "buenos días muchas gracias"
+        ),
+        ({"invalid": "structure"}, ""),
+    ])
+    def test_extract_transcript(self, detector, response, expected):
+        """Test transcript extraction from Deepgram response."""
+        assert detector._extract_transcript(response) == expected
     
-    def test_extract_words(self):
-        """Test word extraction from Deepgram response."""
-        # Valid response
-        valid_response = {
-            "results": {
-                "channels": [{
-                    "alternatives": [{
-                        "words": [
-                            {"word": "buenos", "start": 0.0, "end": 0.5, "confidence": 0.9},
-                            {"word": "días", "start": 0.5, "end": 1.0, "confidence": 0.8},
-                        ]
+    @pytest.mark.parametrize("response,expected", [
+        (
+            {
+                "results": {
+                    "channels": [{
+                        "alternatives": [{
+                            "words": [
+                                {"word": "buenos", "start": 0.0, "end": 0.5, "confidence": 0.9},
+                                {"word": "días", "start": 0.5, "end": 1.0, "confidence": 0.8},
+                            ]
+                        }]
                     }]
-                }]
-            }
-        }
-        
-        result = self.detector._extract_words(valid_response)
-        self.assertEqual(len(result), 2)
-        self.assertEqual(result[0].word, "buenos")
-        self.assertEqual(result[0].start, 0.0)
-        self.assertEqual(result[0].end, 0.5)
-        self.assertEqual(result[0].confidence, 0.9)
-        
-        # Invalid response
-        invalid_response = {"invalid": "structure"}
-        result = self.detector._extract_words(invalid_response)
-        self.assertEqual(result, [])
+                }
+            },
+            [("buenos", 0.0, 0.5, 0.9), ("días", 0.5, 1.0, 0.8)]
+        ),
+        ({"invalid": "structure"}, []),
+    ])
+    def test_extract_words(self, detector, response, expected):
+        """Test word extraction from Deepgram response."""
+        result = detector._extract_words(response)
+        assert [(w.word, w.start, w.end, w.confidence) for w in result] == expected
     
-    def test_extract_duration(self):
-        """Test duration extraction."""
+    @pytest.mark.parametrize("response,words,expected", [
         # From metadata
-        response_with_metadata = {
-            "metadata": {"duration": 120.5}
-        }
-        words = []
-        result = self.detector._extract_duration(response_with_metadata, words)
-        self.assertEqual(result, 120.5)
-        
+        ({"metadata": {"duration": 120.5}}, [], 120.5),
         # From words fallback
-        response_without_metadata = {}
-        words = [
-            Word("test", 0.0, 1.0, 0.9),
-            Word("word", 1.0, 2.5, 0.8)
-        ]
-        result = self.detector._extract_duration(response_without_metadata, words)
-        self.assertEqual(result, 2.5)
-        
+        ({}, [Word("test", 0.0, 1.0, 0.9), Word("word", 1.0, 2.5, 0.8)], 2.5),
         # No data
-        result = self.detector._extract_duration({}, [])
-        self.assertEqual(result, 0.0)
+        ({}, [], 0.0),
+    ])
+    def test_extract_duration(self, detector, response, words, expected):
+        """Test duration extraction."""
+        assert detector._extract_duration(response, words) == expected
     
-    def test_calculate_confidence(self):
-        """Test confidence calculation."""
+    @pytest.mark.parametrize("words,expected", [
         # Normal case
-        words = [
-            Word("test", 0.0, 1.0, 0.9),
-            Word("word", 1.0, 2.0, 0.8),
-            Word("another", 2.0, 3.0, 0.7)
-        ]
-        result = self.detector._calculate_confidence(words)
-        expected = (0.9 + 0.8 + 0.7) / 3
-        self.assertAlmostEqual(result, expected, places=2)
-        
+        (
+            [
+                Word("test", 0.0, 1.0, 0.9),
+                Word("word", 1.0, 2.0, 0.8),
+                Word("another", 2.0, 3.0, 0.7)
+            ],
+            (0.9 + 0.8 + 0.7) / 3
+        ),
         # Empty words
-        result = self.detector._calculate_confidence([])
-        self.assertEqual(result, 0.0)
-        
+        ([], 0.0),
         # Words with zero confidence
-        words_zero = [Word("test", 0.0, 1.0, 0.0)]
-        result = self.detector._calculate_confidence(words_zero)
-        self.assertEqual(result, 0.0)
+        ([Word("test", 0.0, 1.0, 0.0)], 0.0),
+    ])
+    def test_calculate_confidence(self, detector, words, expected):
+        """Test confidence calculation."""
+        assert detector._calculate_confidence(words) == pytest.approx(expected, abs=1e-2)
     
-    def test_find_cortinilla_occurrences(self):
+    def test_find_cortinilla_occurrences(self, detector):
         """Test finding cortinilla occurrences in word list."""
-        words = [
-            Word("buenos", 0.0, 0.5, 0.9),
-            Word("días", 0.5, 1.0, 0.8),
-            Word("y", 1.0, 1.2, 0.7),
-            Word("muchas", 1.2, 1.7, 0.9),
-            Word("gracias", 1.7, 2.2, 0.8),
-            Word("por", 2.2, 2.5, 0.7),
-            Word("todo", 2.5, 3.0, 0.8),
-        ]
-        
         cortinillas = ["buenos días", "muchas gracias", "hasta luego"]
         
-        result = self.detector.find_cortinilla_occurrences(cortinillas, words)
+        result = detector.find_cortinilla_occurrences(cortinillas, _DEMO_WORDS)
         
         # Check "buenos días" found
-        self.assertEqual(len(result["buenos días"]), 1)
+        assert len(result["buenos días"]) == 1
         occurrence = result["buenos días"][0]
-        self.assertEqual(occurrence.start_time, 0.0)
-        self.assertEqual(occurrence.end_time, 1.0)
-        self.assertEqual(occurrence.text, "buenos días")
+        assert occurrence.start_time == 0.0
+        assert occurrence.end_time == 1.0
+        assert occurrence.text == "buenos días"
         
         # Check "muchas gracias" found
-        self.assertEqual(len(result["muchas gracias"]), 1)
+        assert len(result["muchas gracias"]) == 1
         occurrence = result["muchas gracias"][0]
-        self.assertEqual(occurrence.start_time, 1.2)
-        self.assertEqual(occurrence.end_time, 2.2)
+        assert occurrence.start_time == 1.2
+        assert occurrence.end_time == 2.2
         
         # Check "hasta luego" not found
-        self.assertEqual(len(result["hasta luego"]), 0)
+        assert len(result["hasta luego"]) == 0
     
-    def test_find_cortinilla_occurrences_with_accents(self):
+    def test_find_cortinilla_occurrences_with_accents(self, detector):
         """Test cortinilla detection with accent variations."""
         words = [
             Word("buenas", 0.0, 0.5, 0.9),
@@ -237,127 +328,43 @@ class TestCortinillaDetector(unittest.TestCase):
         
         # Search for cortinilla with accents when audio has none
         cortinillas = ["buenas tardes"]
-        result = self.detector.find_cortinilla_occurrences(cortinillas, words)
+        result = detector.find_cortinilla_occurrences(cortinillas, words)
         
-        self.assertEqual(len(result["buenas tardes"]), 1)
+        assert len(result["buenas tardes"]) == 1
     
-    @patch.dict(os.environ, {"DEEPGRAM_API_KEY": "test_key"})
     @patch("requests.post")
-    def test_transcribe_audio_success(self, mock_post):
-        """Test successful audio transcription."""
-        # Mock successful Deepgram response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "results": {
-                "channels": [{
-                    "alternatives": [{
-                        "transcript": "buenos días muchas gracias",
-                        "words": [
-                            {"word": "buenos", "start": 0.0, "end": 0.5, "confidence": 0.9},
-                            {"word": "días", "start": 0.5, "end": 1.0, "confidence": 0.8},
-                            {"word": "muchas", "start": 1.0, "end": 1.5, "confidence": 0.9},
-                            {"word": "gracias", "start": 1.5, "end": 2.0, "confidence": 0.8},
-                        ]
-                    }]
-                }]
-            },
-            "metadata": {"duration": 2.0}
-        }
-        mock_post.return_value = mock_response
-        
-        # Create temporary audio file
-        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as temp_file:
-            temp_file.write(b"fake audio data")
-            temp_path = temp_file.name
-        
-        try:
-            result = self.detector.transcribe_audio(temp_path, self.channel_config, "test_key")
-            
-            self.assertEqual(result.transcript, "buenos días muchas gracias")
-            self.assertEqual(len(result.words), 4)
-            self.assertEqual(result.duration, 2.0)
-            self.assertGreater(result.confidence, 0)
-            
-            # Verify API call
-            mock_post.assert_called_once()
-            call_args = mock_post.call_args
-            self.assertIn("model", call_args[1]["params"])
-            self.assertEqual(call_args[1]["params"]["model"], "nova-3")
-            
-        finally:
-            os.unlink(temp_path)
+    @pytest.mark.parametrize(
+        "responses,error,expected_calls,expected_transcript,expected_fields", _TRANSCRIBE_CASES
+    )
+    def test_transcribe_audio(
+        self, mock_post, detector, channel_config, fake_mp3,
+        responses, error, expected_calls, expected_transcript, expected_fields
+    ):
+        """Test audio transcription across success, retry and failure responses."""
+        mock_post.side_effect = responses
+        
+        if error:
+            with pytest.raises(RuntimeError, match=error):
+                detector.transcribe_audio(fake_mp3, channel_config, "test_key")
+        else:
+            result = detector.transcribe_audio(fake_mp3, channel_config, "test_key")
+            assert result.transcript == expected_transcript
+            if expected_fields:
+                n_words, duration = expected_fields
+                assert len(result.words) == n_words
+                assert result.duration == duration
+                assert result.confidence > 0
+        
+        # Verify API calls
+        assert mock_post.call_count == expected_calls
+        assert mock_post.call_args[1]["params"]["model"] == "nova-3"
     
-    @patch.dict(os.environ, {"DEEPGRAM_API_KEY": "test_key"})
-    def test_transcribe_audio_file_not_found(self):
+    def test_transcribe_audio_file_not_found(self, detector, channel_config):
         """Test transcription with non-existent file."""
-        with self.assertRaises(FileNotFoundError):
-            self.detector.transcribe_audio("nonexistent.mp3", self.channel_config, "test_key")
+        with pytest.raises(FileNotFoundError):
+            detector.transcribe_audio("nonexistent.mp3", channel_config, "test_key")
     
-    @patch.dict(os.environ, {"DEEPGRAM_API_KEY": "test_key"})
-    @patch("requests.post")
-    def test_transcribe_audio_api_error_with_retry(self, mock_post):
-        """Test transcription with API error and retry logic."""
-        # Mock failed responses followed by success
-        mock_response_fail = Mock()
-        mock_response_fail.status_code = 500
-        mock_response_fail.text = "Internal Server Error"
-        
-        mock_response_success = Mock()
-        mock_response_success.status_code = 200
-        mock_response_success.json.return_value = {
-            "results": {
-                "channels": [{
-                    "alternatives": [{
-                        "transcript": "test transcript",
-                        "words": []
-                    }]
-                }]
-            },
-            "metadata": {"duration": 1.0}
-        }
-        
-        mock_post.side_effect = [mock_response_fail, mock_response_fail, mock_response_success]
-        
-        # Create temporary audio file
-        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as temp_file:
-            temp_file.write(b"fake audio data")
-            temp_path = temp_file.name
-        
-        try:
-            result = self.detector.transcribe_audio(temp_path, self.channel_config, "test_key")
-            self.assertEqual(result.transcript, "test transcript")
-            self.assertEqual(mock_post.call_count, 3)  # 2 failures + 1 success
-            
-        finally:
-            os.unlink(temp_path)
-    
-    @patch.dict(os.environ, {"DEEPGRAM_API_KEY": "test_key"})
-    @patch("requests.post")
-    def test_transcribe_audio_max_retries_exceeded(self, mock_post):
-        """Test transcription when max retries are exceeded."""
-        # Mock all responses as failures
-        mock_response = Mock()
-        mock_response.status_code = 500
-        mock_response.text = "Internal Server Error"
-        mock_post.return_value = mock_response
-        
-        # Create temporary audio file
-        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as temp_file:
-            temp_file.write(b"fake audio data")
-            temp_path = temp_file.name
-        
-        try:
-            with self.assertRaises(RuntimeError) as context:
-                self.detector.transcribe_audio(temp_path, self.channel_config, "test_key")
-            
-            self.assertIn("Deepgram API error 500", str(context.exception))
-            self.assertEqual(mock_post.call_count, 3)  # Max retries
-            
-        finally:
-            os.unlink(temp_path)
-    
-    def test_process_with_overlap_filtering_with_detector(self):
+    def test_process_with_overlap_filtering_with_detector(self, detector, overlap_stub):
         """Test processing with overlap detector."""
         transcription_result = TranscriptionResult(
             transcript="test transcript",
@@ -380,23 +387,19 @@ class TestCortinillaDetector(unittest.TestCase):
             similarity_score=0.8
         )
         
-        self.mock_overlap_detector.process_with_overlap_detection.return_value = (
-            filtered_content, overlap_result
-        )
+        overlap_stub.ret = (filtered_content, overlap_result)
         
-        result_filtered, result_overlap = self.detector._process_with_overlap_filtering(
-            "test_channel", transcription_result, datetime.now()
+        result_filtered, result_overlap = detector._process_with_overlap_filtering(
+            "test_channel", transcription_result, FIXED_TS
         )
         
-        self.assertEqual(result_filtered, filtered_content)
-        self.assertEqual(result_overlap, overlap_result)
-        self.mock_overlap_detector.process_with_overlap_detection.assert_called_once()
+        assert result_filtered == filtered_content
+        assert result_overlap == overlap_result
+        assert len(overlap_stub.calls) == 1
     
-    def test_process_with_overlap_filtering_without_detector(self):
+    def test_process_with_overlap_filtering_without_detector(self, detector, monkeypatch):
         """Test processing without overlap detector."""
-        # Create detector and manually set overlap_detector to None
-        detector_no_overlap = CortinillaDetector()
-        detector_no_overlap.overlap_detector = None
+        monkeypatch.setattr(detector, "overlap_detector", None)
         
         transcription_result = TranscriptionResult(
             transcript="test transcript",
@@ -405,29 +408,25 @@ class TestCortinillaDetector(unittest.TestCase):
             duration=1.0
         )
         
-        result_filtered, result_overlap = detector_no_overlap._process_with_overlap_filtering(
-            "test_channel", transcription_result, datetime.now()
+        result_filtered, result_overlap = detector._process_with_overlap_filtering(
+            "test_channel", transcription_result, FIXED_TS
         )
         
         # Should return original content without filtering
-        self.assertEqual(result_filtered.filtered_transcript, "test transcript")
-        self.assertEqual(len(result_filtered.filtered_words), 1)
-        self.assertEqual(result_filtered.removed_duration, 0.0)
-        self.assertFalse(result_overlap.has_overlap)
+        assert result_filtered.filtered_transcript == "test transcript"
+        assert len(result_filtered.filtered_words) == 1
+        assert result_filtered.removed_duration == 0.0
+        assert not result_overlap.has_overlap
     
-    @patch.dict(os.environ, {"DEEPGRAM_API_KEY": "test_key"})
     @patch("src.cortinilla_detector.CortinillaDetector.transcribe_audio")
-    def test_detect_cortinillas_integration(self, mock_transcribe):
+    def test_detect_cortinillas_integration(
+        self, mock_transcribe, detector, overlap_stub, channel_config
+    ):
         """Test full cortinilla detection integration."""
         # Mock transcription result
         transcription_result = TranscriptionResult(
-            transcript="buenos días muchas gracias",
-            words=[
-                Word("buenos", 0.0, 0.5, 0.9),
-                Word("días", 0.5, 1.0, 0.8),
-                Word("muchas", 1.0, 1.5, 0.9),
-                Word("gracias", 1.5, 2.0, 0.8),
-            ],
+            transcript=_DEMO_TRANSCRIPT,
+            words=list(_DEMO_WORDS),
             confidence=0.85,
             duration=2.0
         )
@@ -435,7 +434,7 @@ class TestCortinillaDetector(unittest.TestCase):
         
         # Mock overlap processing
         filtered_content = FilteredContent(
-            filtered_transcript="buenos días muchas gracias",
+            filtered_transcript=_DEMO_TRANSCRIPT,
             filtered_words=transcription_result.words,
             removed_duration=0.0
         )
@@ -447,33 +446,25 @@ class TestCortinillaDetector(unittest.TestCase):
             similarity_score=0.0
         )
         
-        self.mock_overlap_detector.process_with_overlap_detection.return_value = (
-            filtered_content, overlap_result
-        )
+        overlap_stub.ret = (filtered_content, overlap_result)
         
         # Run detection
-        timestamp = datetime.now()
-        result = self.detector.detect_cortinillas("test.mp3", self.channel_config, timestamp)
+        result = detector.detect_cortinillas("test.mp3", channel_config, FIXED_TS)
         
         # Verify results
-        self.assertEqual(result.channel, "Test Channel")
-        self.assertEqual(result.timestamp, timestamp)
-        self.assertEqual(result.audio_duration, 2.0)
-        self.assertEqual(result.total_cortinillas, 2)  # "buenos días" and "muchas gracias"
-        self.assertEqual(result.cortinillas_by_type["buenos días"], 1)
-        self.assertEqual(result.cortinillas_by_type["muchas gracias"], 1)
-        self.assertEqual(result.cortinillas_by_type["buenas tardes"], 0)
-        self.assertFalse(result.overlap_filtered)
-        self.assertIsNone(result.overlap_duration)
+        assert result.channel == "Test Channel"
+        assert result.timestamp == FIXED_TS
+        assert result.audio_duration == 2.0
+        assert result.total_cortinillas == 2  # "buenos días" and "muchas gracias"
+        assert result.cortinillas_by_type["buenos días"] == 1
+        assert result.cortinillas_by_type["muchas gracias"] == 1
+        assert result.cortinillas_by_type["buenas tardes"] == 0
+        assert not result.overlap_filtered
+        assert result.overlap_duration is None
     
-    def test_detect_cortinillas_missing_api_key(self):
+    def test_detect_cortinillas_missing_api_key(self, detector, channel_config, monkeypatch):
         """Test cortinilla detection without API key."""
-        with patch.dict(os.environ, {}, clear=True):
-            with self.assertRaises(ValueError) as context:
-                self.detector.detect_cortinillas("test.mp3", self.channel_config, datetime.now())
-            
-            self.assertIn("DEEPGRAM_API_KEY", str(context.exception))
-
-
-if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+        monkeypatch.delenv("DEEPGRAM_API_KEY", raising=False)
+        
+        with pytest.raises(ValueError, match="DEEPGRAM_API_KEY"):
+            detector.detect_cortinillas("test.mp3", channel_config, FIXED_TS)
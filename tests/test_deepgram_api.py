@@ -7,11 +7,13 @@ import requests
 import os
 from dotenv import load_dotenv
 
+# Only read .env when the key isn't already in the environment
+if not os.environ.get('DEEPGRAM_API_KEY'):
+    load_dotenv()
+
 def test_deepgram_api():
     """Test if Deepgram API key is valid."""
     
-    # Load environment variables
-    load_dotenv()
     api_key = os.getenv('DEEPGRAM_API_KEY')
     
     if not api_key:
@@ -70,39 +72,38 @@ def test_deepgram_api():
 def test_deepgram_usage():
     """Test Deepgram usage/billing info."""
     
-    load_dotenv()
     api_key = os.getenv('DEEPGRAM_API_KEY')
     
     if not api_key:
         return
     
-    headers = {'Authorization': f'Token {api_key}'}
-    
     try:
-        # Get first project
-        projects_response = requests.get(
-            'https://api.deepgram.com/v1/projects', 
-            headers=headers,
-            timeout=10
-        )
-        
-        if projects_response.status_code == 200:
-            projects = projects_response.json().get('projects', [])
-            if projects:
-                project_id = projects[0]['project_id']
-                
-                # Get usage info
-                usage_response = requests.get(
-                    f'https://api.deepgram.com/v1/projects/{project_id}/usage',
-                    headers=headers,
-                    timeout=10
-                )
-                
-                if usage_response.status_code == 200:
-                    usage = usage_response.json()
-                    print(f"\n💰 Información de uso:")
-                    print(f"📊 Requests este mes: {usage.get('requests', 'N/A')}")
-                    print(f"⏱️  Horas procesadas: {usage.get('hours', 'N/A')}")
+        # Reuse one connection for both requests
+        with requests.Session() as session:
+            session.headers.update({'Authorization': f'Token {api_key}'})
+            
+            # Get first project
+            projects_response = session.get(
+                'https://api.deepgram.com/v1/projects', 
+                timeout=10
+            )
+            
+            if projects_response.status_code == 200:
+                projects = projects_response.json().get('projects', [])
+                if projects:
+                    project_id = projects[0]['project_id']
+                    
+                    # Get usage info
+                    usage_response = session.get(
+                        f'https://api.deepgram.com/v1/projects/{project_id}/usage',
+                        timeout=10
+                    )
+                    
+                    if usage_response.status_code == 200:
+                        usage = usage_response.json()
+                        print(f"\n💰 Información de uso:")
+                        print(f"📊 Requests este mes: {usage.get('requests', 'N/A')}")
+                        print(f"⏱️  Horas procesadas: {usage.get('hours', 'N/A')}")
                 
     except Exception as e:
         print(f"⚠️  No se pudo obtener info de uso: {e}")
@@ -2,14 +2,10 @@
 Tests for error handling and recovery mechanisms.
 """
 import pytest
-import time
+import requests
 from datetime import datetime
 from unittest.mock import Mock, patch
 
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from error_handler import ErrorHandler, safe_execute, categorize_error, create_error_context
 from exceptions import (
     TVAudioMonitorError, RetryableError, NetworkError, 
@@ -17,6 +13,36 @@ from exceptions import (
 )
 
 
+@pytest.fixture
+def handler():
+    """Create a fresh ErrorHandler with short retry delays."""
+    return ErrorHandler(max_retries=2, base_delay=0.1)
+
+
+@pytest.fixture
+def make_flaky(handler):
+    """
+    Build retry-decorated functions that fail a given number of times.
+    
+    Returns a factory giving ``(function, calls)``, where ``calls["n"]``
+    counts invocations. Backoff sleeps are skipped.
+    """
+    def _make(fail_count, exc=NetworkError, retryable=(NetworkError,)):
+        calls = {"n": 0}
+        
+        @handler.retry_on_error(retryable_exceptions=retryable)
+        def flaky():
+            calls["n"] += 1
+            if calls["n"] <= fail_count:
+                raise exc(f"Failure {calls['n']}")
+            return "success"
+        
+        return flaky, calls
+    
+    with patch('error_handler.time.sleep'):
+        yield _make
+
+
 class TestErrorHandler:
     """Test cases for ErrorHandler class."""
     
@@ -28,59 +54,38 @@ class TestErrorHandler:
         assert handler.error_counts == {}
         assert handler.last_errors == {}
     
-    def test_retry_decorator_success(self):
+    def test_retry_decorator_success(self, make_flaky):
         """Test retry decorator with successful function."""
-        handler = ErrorHandler(max_retries=3)
-        
-        @handler.retry_on_error()
-        def successful_function():
-            return "success"
+        successful_function, calls = make_flaky(0)
         
-        result = successful_function()
-        assert result == "success"
+        assert successful_function() == "success"
+        assert calls["n"] == 1
     
-    def test_retry_decorator_with_retryable_error(self):
+    def test_retry_decorator_with_retryable_error(self, make_flaky):
         """Test retry decorator with retryable errors."""
-        handler = ErrorHandler(max_retries=2, base_delay=0.1)
-        call_count = 0
-        
-        @handler.retry_on_error(retryable_exceptions=(NetworkError,))
-        def failing_function():
-            nonlocal call_count
-            call_count += 1
-            if call_count < 3:
-                raise NetworkError("Network failure")
-            return "success"
+        failing_function, calls = make_flaky(2)
         
-        result = failing_function()
-        assert result == "success"
-        assert call_count == 3
+        assert failing_function() == "success"
+        assert calls["n"] == 3
     
-    def test_retry_decorator_exhausted_retries(self):
+    def test_retry_decorator_exhausted_retries(self, make_flaky):
         """Test retry decorator when all retries are exhausted."""
-        handler = ErrorHandler(max_retries=2, base_delay=0.1)
-        
-        @handler.retry_on_error(retryable_exceptions=(NetworkError,))
-        def always_failing_function():
-            raise NetworkError("Persistent network failure")
+        always_failing_function, calls = make_flaky(3)
         
         with pytest.raises(NetworkError):
             always_failing_function()
+        assert calls["n"] == 3
     
-    def test_retry_decorator_non_retryable_error(self):
+    def test_retry_decorator_non_retryable_error(self, make_flaky):
         """Test retry decorator with non-retryable errors."""
-        handler = ErrorHandler(max_retries=3)
-        
-        @handler.retry_on_error(retryable_exceptions=(NetworkError,))
-        def function_with_non_retryable_error():
-            raise ValueError("Non-retryable error")
+        function_with_non_retryable_error, calls = make_flaky(1, exc=ValueError)
         
         with pytest.raises(ValueError):
             function_with_non_retryable_error()
+        assert calls["n"] == 1
     
-    def test_handle_error(self):
+    def test_handle_error(self, handler):
         """Test error handling and tracking."""
-        handler = ErrorHandler()
         error = NetworkError("Test error")
         context = "test_context"
         
@@ -91,10 +96,8 @@ class TestErrorHandler:
         assert context in handler.last_errors
         assert handler.last_errors[context]['error_type'] == 'NetworkError'
     
-    def test_get_error_summary(self):
+    def test_get_error_summary(self, handler):
         """Test error summary generation."""
-        handler = ErrorHandler()
-        
         # Add some errors
         handler.handle_error(NetworkError("Error 1"), "context1")
         handler.handle_error(APIConnectionError("Error 2"), "context2")
@@ -107,10 +110,8 @@ class TestErrorHandler:
         assert summary['error_counts']['context2'] == 1
         assert len(summary['last_errors']) == 2
     
-    def test_reset_error_tracking(self):
+    def test_reset_error_tracking(self, handler):
         """Test error tracking reset."""
-        handler = ErrorHandler()
-        
         # Add some errors
         handler.handle_error(NetworkError("Error"), "context")
         assert len(handler.error_counts) > 0
@@ -140,10 +141,8 @@ class TestSafeExecute:
         result = safe_execute(failing_function, default_return="default")
         assert result == "default"
     
-    def test_safe_execute_with_custom_error_handler(self):
+    def test_safe_execute_with_custom_error_handler(self, handler):
         """Test safe_execute with custom error handler."""
-        handler = ErrorHandler()
-        
         def failing_function():
             raise NetworkError("Test error")
         
@@ -161,39 +160,23 @@ class TestSafeExecute:
 class TestErrorCategorization:
     """Test cases for error categorization."""
     
-    def test_categorize_network_errors(self):
-        """Test categorization of network errors."""
-        import requests
-        
-        assert categorize_error(ConnectionError()) == "network"
-        assert categorize_error(requests.ConnectionError()) == "network"
-    
-    def test_categorize_timeout_errors(self):
-        """Test categorization of timeout errors."""
-        import requests
-        
-        assert categorize_error(TimeoutError()) == "timeout"
-        assert categorize_error(requests.Timeout()) == "timeout"
-    
-    def test_categorize_file_errors(self):
-        """Test categorization of file errors."""
-        assert categorize_error(FileNotFoundError()) == "file_not_found"
-        assert categorize_error(PermissionError()) == "permission"
-    
-    def test_categorize_validation_errors(self):
-        """Test categorization of validation errors."""
-        assert categorize_error(ValueError()) == "validation"
-        assert categorize_error(TypeError()) == "validation"
-        assert categorize_error(KeyError()) == "missing_data"
-    
-    def test_categorize_application_errors(self):
-        """Test categorization of application errors."""
-        assert categorize_error(TVAudioMonitorError()) == "application"
-        assert categorize_error(NetworkError()) == "application"
-    
-    def test_categorize_unknown_errors(self):
-        """Test categorization of unknown errors."""
-        assert categorize_error(RuntimeError()) == "unknown"
+    @pytest.mark.parametrize("error,expected", [
+        (ConnectionError(), "network"),
+        (requests.ConnectionError(), "network"),
+        (TimeoutError(), "timeout"),
+        (requests.Timeout(), "timeout"),
+        (FileNotFoundError(), "file_not_found"),
+        (PermissionError(), "permission"),
+        (ValueError(), "validation"),
+        (TypeError(), "validation"),
+        (KeyError(), "missing_data"),
+        (TVAudioMonitorError(), "application"),
+        (NetworkError(), "application"),
+        (RuntimeError(), "unknown"),
+    ])
+    def test_categorize_error(self, error, expected):
+        """Test categorization of network, file, validation and application errors."""
+        assert categorize_error(error) == expected
 
 
 class TestErrorContext:
@@ -250,53 +233,41 @@ class TestRetryLogic:
     def test_exponential_backoff(self):
         """Test exponential backoff timing."""
         handler = ErrorHandler(max_retries=3, base_delay=0.1)
-        call_times = []
         
         @handler.retry_on_error(
             retryable_exceptions=(NetworkError,),
             backoff_factor=2.0
         )
         def failing_function():
-            call_times.append(time.time())
             raise NetworkError("Test error")
         
-        start_time = time.time()
-        
-        with pytest.raises(NetworkError):
-            failing_function()
+        with patch('error_handler.time.sleep') as mock_sleep:
+            with pytest.raises(NetworkError):
+                failing_function()
         
-        # Check that delays increase exponentially
-        assert len(call_times) == 4  # Initial call + 3 retries
-        
-        # Verify approximate timing (allowing for some variance)
-        if len(call_times) >= 2:
-            delay1 = call_times[1] - call_times[0]
-            assert 0.08 <= delay1 <= 0.15  # ~0.1 seconds
-        
-        if len(call_times) >= 3:
-            delay2 = call_times[2] - call_times[1]
-            assert 0.18 <= delay2 <= 0.25  # ~0.2 seconds
+        # Initial call + 3 retries, with delays doubling between attempts
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        assert delays == pytest.approx([0.1, 0.2, 0.4])
     
     def test_max_delay_limit(self):
         """Test maximum delay limit."""
         handler = ErrorHandler(max_retries=2, base_delay=10.0)
-        call_times = []
         
         @handler.retry_on_error(
             retryable_exceptions=(NetworkError,),
             max_delay=0.2  # Very low max delay
         )
         def failing_function():
-            call_times.append(time.time())
             raise NetworkError("Test error")
         
-        with pytest.raises(NetworkError):
-            failing_function()
+        with patch('error_handler.time.sleep') as mock_sleep:
+            with pytest.raises(NetworkError):
+                failing_function()
         
-        # Check that delay doesn't exceed max_delay
-        if len(call_times) >= 2:
-            delay = call_times[1] - call_times[0]
-            assert delay <= 0.25  # Should be capped at max_delay
+        # Check that no delay exceeds max_delay
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        assert len(delays) == 2
+        assert all(delay <= 0.2 for delay in delays)
 
 
 if __name__ == "__main__":
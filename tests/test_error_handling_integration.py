@@ -2,15 +2,11 @@
 Integration tests for error handling across components.
 """
 import pytest
-import tempfile
 import os
 import json
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
 
-import sys
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from models import ChannelConfig, DeepgramConfig, APIConfig, CortinillaResult
 from config_manager import ConfigManager
 from audio_extractor import AudioExtractor
@@ -23,82 +19,100 @@ from exceptions import (
 )
 
 
+@pytest.fixture(scope="module")
+def audio_config():
+    """Create the channel configuration used by the audio extractor tests."""
+    return ChannelConfig(
+        channel_name="test_channel",
+        idemisora=1,
+        idprograma=5,
+        cortinillas=["test"],
+        deepgram_config=DeepgramConfig("multi", "nova-3", True),
+        api_config=APIConfig(
+            base_url="http://test.com",
+            cookie_sid="test_sid",
+            format=11,
+            video_is_public=0,
+            is_masive=1,
+            max_retries=2,
+            sleep_seconds=1
+        )
+    )
+
+
+@pytest.fixture(scope="module")
+def detector_config():
+    """Create the channel configuration used by the cortinilla detector tests."""
+    return ChannelConfig(
+        channel_name="test_channel",
+        idemisora=1,
+        idprograma=5,
+        cortinillas=["buenos días", "buenas tardes"],
+        deepgram_config=DeepgramConfig("multi", "nova-3", True),
+        api_config=APIConfig(
+            base_url="http://test.com",
+            cookie_sid="test_sid",
+            format=11,
+            video_is_public=0,
+            is_masive=1,
+            max_retries=3,
+            sleep_seconds=30
+        )
+    )
+
+
 class TestConfigManagerErrorHandling:
     """Test error handling in ConfigManager."""
     
-    def test_load_nonexistent_config(self):
+    def test_load_nonexistent_config(self, tmp_path):
         """Test loading non-existent configuration file."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_manager = ConfigManager(temp_dir)
-            
-            with pytest.raises(FileNotFoundError):
-                config_manager.load_channel_config("nonexistent.json")
+        config_manager = ConfigManager(str(tmp_path))
+        
+        with pytest.raises(FileNotFoundError):
+            config_manager.load_channel_config("nonexistent.json")
     
-    def test_load_invalid_json_config(self):
+    def test_load_invalid_json_config(self, tmp_path):
         """Test loading invalid JSON configuration."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_manager = ConfigManager(temp_dir)
-            
-            # Create invalid JSON file
-            invalid_config_path = os.path.join(temp_dir, "invalid.json")
-            with open(invalid_config_path, 'w') as f:
-                f.write("{ invalid json }")
-            
-            with pytest.raises(ConfigurationError):
-                config_manager.load_channel_config(invalid_config_path)
+        config_manager = ConfigManager(str(tmp_path))
+        
+        # Create invalid JSON file
+        invalid_config_path = str(tmp_path / "invalid.json")
+        with open(invalid_config_path, 'w') as f:
+            f.write("{ invalid json }")
+        
+        with pytest.raises(ConfigurationError):
+            config_manager.load_channel_config(invalid_config_path)
     
-    def test_load_incomplete_config(self):
+    def test_load_incomplete_config(self, tmp_path):
         """Test loading incomplete configuration."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_manager = ConfigManager(temp_dir)
-            
-            # Create incomplete config
-            incomplete_config = {"channel_name": "test"}
-            config_path = os.path.join(temp_dir, "incomplete.json")
-            with open(config_path, 'w') as f:
-                json.dump(incomplete_config, f)
-            
-            with pytest.raises(ConfigurationError):
-                config_manager.load_channel_config(config_path)
+        config_manager = ConfigManager(str(tmp_path))
+        
+        # Create incomplete config
+        incomplete_config = {"channel_name": "test"}
+        config_path = str(tmp_path / "incomplete.json")
+        with open(config_path, 'w') as f:
+            json.dump(incomplete_config, f)
+        
+        with pytest.raises(ConfigurationError):
+            config_manager.load_channel_config(config_path)
     
-    def test_create_default_configs_on_empty_directory(self):
+    def test_create_default_configs_on_empty_directory(self, tmp_path):
         """Test creating default configs when directory is empty."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_manager = ConfigManager(temp_dir)
-            
-            channels = config_manager.load_all_channels()
-            
-            # Should create default configurations
-            assert len(channels) >= 2
-            assert "channel1" in channels or "channel2" in channels
+        config_manager = ConfigManager(str(tmp_path))
+        
+        channels = config_manager.load_all_channels()
+        
+        # Should create default configurations
+        assert len(channels) >= 2
+        assert "channel1" in channels or "channel2" in channels
 
 
 class TestAudioExtractorErrorHandling:
     """Test error handling in AudioExtractor."""
     
-    def create_test_config(self):
-        """Create a test configuration."""
-        return ChannelConfig(
-            channel_name="test_channel",
-            idemisora=1,
-            idprograma=5,
-            cortinillas=["test"],
-            deepgram_config=DeepgramConfig("multi", "nova-3", True),
-            api_config=APIConfig(
-                base_url="http://test.com",
-                cookie_sid="test_sid",
-                format=11,
-                video_is_public=0,
-                is_masive=1,
-                max_retries=2,
-                sleep_seconds=1
-            )
-        )
-    
     @patch('requests.Session')
-    def test_network_error_retry(self, mock_session_class):
+    def test_network_error_retry(self, mock_session_class, audio_config):
         """Test network error retry logic."""
-        config = self.create_test_config()
         
         # Mock session to raise network errors
         mock_session = Mock()
@@ -109,7 +123,7 @@ class TestAudioExtractorErrorHandling:
             Mock(status_code=200, json=lambda: {"id": "test_id"})
         ]
         
-        extractor = AudioExtractor(config)
+        extractor = AudioExtractor(audio_config)
         
         # Should succeed after retries
         start_time = datetime.now()
@@ -121,10 +135,8 @@ class TestAudioExtractorErrorHandling:
             extractor.store_clip(start_time, end_time, "test_clip")
     
     @patch('requests.Session')
-    def test_api_error_handling(self, mock_session_class):
+    def test_api_error_handling(self, mock_session_class, audio_config):
         """Test API error handling."""
-        config = self.create_test_config()
-        
         mock_session = Mock()
         mock_session_class.return_value = mock_session
         mock_response = Mock()
@@ -132,7 +144,7 @@ class TestAudioExtractorErrorHandling:
         mock_response.raise_for_status.side_effect = Exception("Server error")
         mock_session.post.return_value = mock_response
         
-        extractor = AudioExtractor(config)
+        extractor = AudioExtractor(audio_config)
         
         with pytest.raises(Exception):
             start_time = datetime.now()
@@ -143,60 +155,37 @@ class TestAudioExtractorErrorHandling:
 class TestCortinillaDetectorErrorHandling:
     """Test error handling in CortinillaDetector."""
     
-    def create_test_config(self):
-        """Create a test configuration."""
-        return ChannelConfig(
-            channel_name="test_channel",
-            idemisora=1,
-            idprograma=5,
-            cortinillas=["buenos días", "buenas tardes"],
-            deepgram_config=DeepgramConfig("multi", "nova-3", True),
-            api_config=APIConfig(
-                base_url="http://test.com",
-                cookie_sid="test_sid",
-                format=11,
-                video_is_public=0,
-                is_masive=1,
-                max_retries=3,
-                sleep_seconds=30
-            )
-        )
-    
-    def test_missing_audio_file(self):
+    def test_missing_audio_file(self, detector_config):
         """Test handling of missing audio file."""
         detector = CortinillaDetector()
-        config = self.create_test_config()
         
         with pytest.raises(TranscriptionError):
             detector.detect_cortinillas(
                 "nonexistent_file.mp3",
-                config,
+                detector_config,
                 datetime.now()
             )
     
-    def test_missing_api_key(self):
+    def test_missing_api_key(self, detector_config, tmp_path):
         """Test handling of missing Deepgram API key."""
         detector = CortinillaDetector()
-        config = self.create_test_config()
         
-        with tempfile.NamedTemporaryFile(suffix=".mp3") as temp_audio:
-            # Write some dummy data
-            temp_audio.write(b"dummy audio data")
-            temp_audio.flush()
-            
-            with patch.dict(os.environ, {}, clear=True):
-                with pytest.raises(TranscriptionError):
-                    detector.detect_cortinillas(
-                        temp_audio.name,
-                        config,
-                        datetime.now()
-                    )
+        # The detector rejects empty files, so write a single byte
+        audio_path = tmp_path / "dummy.mp3"
+        audio_path.write_bytes(b"x")
+        
+        with patch.dict(os.environ, {}, clear=True):
+            with pytest.raises(TranscriptionError):
+                detector.detect_cortinillas(
+                    str(audio_path),
+                    detector_config,
+                    datetime.now()
+                )
     
     @patch('requests.post')
-    def test_deepgram_api_error(self, mock_post):
+    def test_deepgram_api_error(self, mock_post, detector_config, tmp_path):
         """Test handling of Deepgram API errors."""
         detector = CortinillaDetector()
-        config = self.create_test_config()
         
         # Mock API error response
         mock_response = Mock()
@@ -204,17 +193,16 @@ class TestCortinillaDetectorErrorHandling:
         mock_response.text = "Internal Server Error"
         mock_post.return_value = mock_response
         
-        with tempfile.NamedTemporaryFile(suffix=".mp3") as temp_audio:
-            temp_audio.write(b"dummy audio data")
-            temp_audio.flush()
-            
-            with patch.dict(os.environ, {"DEEPGRAM_API_KEY": "test_key"}):
-                with pytest.raises(TranscriptionError):
-                    detector.detect_cortinillas(
-                        temp_audio.name,
-                        config,
-                        datetime.now()
-                    )
+        audio_path = tmp_path / "dummy.mp3"
+        audio_path.write_bytes(b"x")
+        
+        with patch.dict(os.environ, {"DEEPGRAM_API_KEY": "test_key"}):
+            with pytest.raises(TranscriptionError):
+                detector.detect_cortinillas(
+                    str(audio_path),
+                    detector_config,
+                    datetime.now()
+                )
 
 
 class TestOverlapDetectorErrorHandling:
@@ -227,34 +215,32 @@ class TestOverlapDetectorErrorHandling:
             with pytest.raises(PermissionError):
                 OverlapDetector("/invalid/path/that/cannot/be/created")
     
-    def test_corrupted_cache_file(self):
+    def test_corrupted_cache_file(self, tmp_path):
         """Test handling of corrupted cache file."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            detector = OverlapDetector(temp_dir)
-            
-            # Create corrupted cache file
-            cache_path = detector._get_cache_path("test_channel")
-            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
-            with open(cache_path, 'w') as f:
-                f.write("corrupted json data {")
-            
-            # Should handle corrupted file gracefully
-            result = detector.load_previous_transcript("test_channel")
-            assert result is None
+        detector = OverlapDetector(str(tmp_path))
+        
+        # Create corrupted cache file
+        cache_path = detector._get_cache_path("test_channel")
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, 'w') as f:
+            f.write("corrupted json data {")
+        
+        # Should handle corrupted file gracefully
+        result = detector.load_previous_transcript("test_channel")
+        assert result is None
     
-    def test_cache_file_permission_error(self):
+    def test_cache_file_permission_error(self, tmp_path):
         """Test handling of cache file permission errors."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            detector = OverlapDetector(temp_dir)
-            
-            # Mock permission error during save
-            with patch('builtins.open', side_effect=PermissionError("Permission denied")):
-                # Should not raise exception, just log error
-                detector.save_transcript_cache(
-                    "test_channel",
-                    "test transcript",
-                    datetime.now()
-                )
+        detector = OverlapDetector(str(tmp_path))
+        
+        # Mock permission error during save
+        with patch('builtins.open', side_effect=PermissionError("Permission denied")):
+            # Should not raise exception, just log error
+            detector.save_transcript_cache(
+                "test_channel",
+                "test transcript",
+                datetime.now()
+            )
 
 
 class TestReportGeneratorErrorHandling:
@@ -273,64 +259,55 @@ class TestReportGeneratorErrorHandling:
             overlap_duration=None
         )
     
-    def test_permission_error_on_json_write(self):
+    def test_permission_error_on_json_write(self, tmp_path):
         """Test handling of permission errors during JSON write."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            generator = ReportGenerator(temp_dir)
-            result = self.create_test_result()
-            
-            # Mock permission error
-            with patch('builtins.open', side_effect=PermissionError("Permission denied")):
-                with pytest.raises(Exception):  # Should be wrapped in ReportGenerationError
-                    generator.update_json_report(result)
+        generator = ReportGenerator(str(tmp_path))
+        result = self.create_test_result()
+        
+        # Mock permission error
+        with patch('builtins.open', side_effect=PermissionError("Permission denied")):
+            with pytest.raises(Exception):  # Should be wrapped in ReportGenerationError
+                generator.update_json_report(result)
     
-    def test_disk_full_error_on_excel_write(self):
+    def test_disk_full_error_on_excel_write(self, tmp_path):
         """Test handling of disk full errors during Excel write."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            generator = ReportGenerator(temp_dir)
-            result = self.create_test_result()
-            
-            # Mock disk full error
-            with patch('openpyxl.Workbook.save', side_effect=OSError("No space left on device")):
-                with pytest.raises(Exception):  # Should be wrapped in ReportGenerationError
-                    generator.update_excel_report(result)
+        generator = ReportGenerator(str(tmp_path))
+        result = self.create_test_result()
+        
+        # Mock disk full error
+        with patch('openpyxl.Workbook.save', side_effect=OSError("No space left on device")):
+            with pytest.raises(Exception):  # Should be wrapped in ReportGenerationError
+                generator.update_excel_report(result)
     
-    def test_corrupted_existing_json_file(self):
+    def test_corrupted_existing_json_file(self, tmp_path):
         """Test handling of corrupted existing JSON files."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            generator = ReportGenerator(temp_dir)
-            result = self.create_test_result()
-            
-            # Create corrupted JSON file
-            json_path = os.path.join(temp_dir, f"{result.channel}_results.json")
-            with open(json_path, 'w') as f:
-                f.write("{ corrupted json")
-            
-            # Should handle corrupted file and create new one
-            generator.update_json_report(result)
-            
-            # Verify file was recreated
-            assert os.path.exists(json_path)
+        generator = ReportGenerator(str(tmp_path))
+        result = self.create_test_result()
+        
+        # Create corrupted JSON file
+        json_path = str(tmp_path / f"{result.channel}_results.json")
+        with open(json_path, 'w') as f:
+            f.write("{ corrupted json")
+        
+        # Should handle corrupted file and create new one
+        generator.update_json_report(result)
+        
+        # Verify file was recreated
+        assert os.path.exists(json_path)
 
 
+@pytest.mark.skip(reason="recovery scenarios not implemented")
 class TestErrorRecoveryScenarios:
     """Test error recovery scenarios across components."""
     
     def test_partial_system_failure_recovery(self):
         """Test recovery from partial system failures."""
-        # This would test scenarios where some components fail
-        # but the system continues processing other channels
-        pass
     
     def test_temporary_network_failure_recovery(self):
         """Test recovery from temporary network failures."""
-        # This would test retry mechanisms across network operations
-        pass
     
     def test_disk_space_recovery(self):
         """Test recovery from disk space issues."""
-        # This would test cleanup and space management
-        pass
 
 
 if __name__ == "__main__":
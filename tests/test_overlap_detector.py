@@ -1,311 +1,297 @@
 """
 Unit tests for the overlap detection system.
 """
-import json
 import os
-import tempfile
-import unittest
 from datetime import datetime
-from unittest.mock import patch, mock_open
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
 
 from src.overlap_detector import OverlapDetector
-from src.models import OverlapResult, FilteredContent, Word, TranscriptionResult
+from src.models import OverlapResult, Word, TranscriptionResult
+
+
+SAMPLE_WORDS = (
+    Word("buenos", 0.0, 0.5, 0.9),
+    Word("días", 0.5, 1.0, 0.9),
+    Word("queridos", 1.0, 1.5, 0.8),
+    Word("televidentes", 1.5, 2.5, 0.9),
+    Word("hoy", 2.5, 3.0, 0.9),
+    Word("tenemos", 3.0, 3.5, 0.8),
+    Word("noticias", 3.5, 4.0, 0.9),
+    Word("importantes", 4.0, 5.0, 0.8)
+)
+SAMPLE_TRANSCRIPT = "buenos días queridos televidentes hoy tenemos noticias importantes"
+
+
+@pytest.fixture
+def detector(tmp_path):
+    """Create an OverlapDetector caching into a per-test directory."""
+    return OverlapDetector(cache_dir=str(tmp_path))
+
 
+@pytest.fixture(scope="module")
+def pure_detector(tmp_path_factory):
+    """Create one OverlapDetector shared by tests that never touch the cache."""
+    return OverlapDetector(cache_dir=str(tmp_path_factory.mktemp("pure")))
 
-class TestOverlapDetector(unittest.TestCase):
+
+@pytest.fixture(scope="module")
+def transcription_result():
+    """Transcription of the sample words, shared read-only by pipeline tests."""
+    return TranscriptionResult(
+        transcript=SAMPLE_TRANSCRIPT,
+        words=list(SAMPLE_WORDS),
+        confidence=0.9,
+        duration=5.0
+    )
+
+
+class TestOverlapDetector:
     """Test cases for OverlapDetector class."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
-        self.detector = OverlapDetector(cache_dir=self.temp_dir)
-        
-        # Sample words for testing
-        self.sample_words = [
-            Word("buenos", 0.0, 0.5, 0.9),
-            Word("días", 0.5, 1.0, 0.9),
-            Word("queridos", 1.0, 1.5, 0.8),
-            Word("televidentes", 1.5, 2.5, 0.9),
-            Word("hoy", 2.5, 3.0, 0.9),
-            Word("tenemos", 3.0, 3.5, 0.8),
-            Word("noticias", 3.5, 4.0, 0.9),
-            Word("importantes", 4.0, 5.0, 0.8)
-        ]
-        
-        self.sample_transcript = "buenos días queridos televidentes hoy tenemos noticias importantes"
-    
-    def tearDown(self):
-        """Clean up test fixtures."""
-        # Clean up temp directory
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-    
-    def test_init_creates_cache_directory(self):
+    def test_init_creates_cache_directory(self, tmp_path):
         """Test that initialization creates cache directory."""
-        self.assertTrue(os.path.exists(self.temp_dir))
+        cache_dir = tmp_path / "cache"
+        OverlapDetector(cache_dir=str(cache_dir))
+        assert cache_dir.is_dir()
     
-    def test_clean_transcript(self):
+    def test_clean_transcript(self, pure_detector):
         """Test transcript cleaning functionality."""
         dirty_transcript = "  Buenos   DÍAS,  queridos\n\ttelevidentes!  "
         expected = "buenos días, queridos televidentes!"
         
-        result = self.detector._clean_transcript(dirty_transcript)
-        self.assertEqual(result, expected)
+        result = pure_detector._clean_transcript(dirty_transcript)
+        assert result == expected
     
-    def test_detect_overlap_no_previous_transcript(self):
+    def test_detect_overlap_no_previous_transcript(self, pure_detector):
         """Test overlap detection when no previous transcript exists."""
         current = "buenos días queridos televidentes"
         previous = None
         
-        result = self.detector.detect_overlap(current, previous)
+        result = pure_detector.detect_overlap(current, previous)
         
-        self.assertFalse(result.has_overlap)
-        self.assertIsNone(result.overlap_start)
-        self.assertIsNone(result.overlap_end)
-        self.assertIsNone(result.overlap_duration)
-        self.assertEqual(result.similarity_score, 0.0)
+        assert not result.has_overlap
+        assert result.overlap_start is None
+        assert result.overlap_end is None
+        assert result.overlap_duration is None
+        assert result.similarity_score == 0.0
     
-    def test_detect_overlap_no_similarity(self):
+    def test_detect_overlap_no_similarity(self, pure_detector):
         """Test overlap detection with completely different transcripts."""
         current = "buenos días queridos televidentes"
         previous = "muchas gracias por su atención hasta mañana"
         
-        result = self.detector.detect_overlap(current, previous)
+        result = pure_detector.detect_overlap(current, previous)
         
-        self.assertFalse(result.has_overlap)
-        self.assertIsNone(result.overlap_start)
-        self.assertIsNone(result.overlap_end)
-        self.assertIsNone(result.overlap_duration)
-        self.assertLess(result.similarity_score, 0.7)
+        assert not result.has_overlap
+        assert result.overlap_start is None
+        assert result.overlap_end is None
+        assert result.overlap_duration is None
+        assert result.similarity_score == pytest.approx(0.368421, abs=1e-6)
     
-    def test_detect_overlap_with_similarity(self):
+    def test_detect_overlap_with_similarity(self, pure_detector):
         """Test overlap detection with similar content."""
         # Previous transcript ends with content that current starts with
         previous = "noticias del día muchas gracias buenos días queridos televidentes"
         current = "buenos días queridos televidentes hoy tenemos más noticias"
         
-        result = self.detector.detect_overlap(current, previous)
+        result = pure_detector.detect_overlap(current, previous)
         
-        self.assertTrue(result.has_overlap)
-        self.assertEqual(result.overlap_start, 0.0)
-        self.assertGreaterEqual(result.similarity_score, 0.7)
+        assert result.has_overlap
+        assert result.overlap_start == 0.0
+        assert result.similarity_score >= 0.7
     
-    def test_find_text_overlap_exact_match(self):
+    def test_find_text_overlap_exact_match(self, pure_detector):
         """Test finding exact text overlap."""
         current = "buenos días queridos televidentes hoy tenemos noticias"
         previous = "programa anterior buenos días queridos televidentes"
         
-        result = self.detector._find_text_overlap(current, previous)
+        result = pure_detector._find_text_overlap(current, previous)
         
-        self.assertTrue(result.has_overlap)
-        self.assertGreaterEqual(result.similarity_score, 0.9)
+        assert result.has_overlap
+        assert result.similarity_score >= 0.9
     
-    def test_find_text_overlap_partial_match(self):
+    def test_find_text_overlap_partial_match(self, pure_detector):
         """Test finding partial text overlap."""
         current = "buenos días queridos amigos hoy tenemos noticias"
         previous = "programa anterior buenos días queridos televidentes"
         
-        result = self.detector._find_text_overlap(current, previous)
+        result = pure_detector._find_text_overlap(current, previous)
         
-        # Should detect some similarity but maybe not enough for overlap
-        self.assertGreater(result.similarity_score, 0.0)
+        # The first three words appear verbatim in previous, which counts
+        # as an exact substring match
+        assert result.similarity_score == pytest.approx(1.0, abs=1e-6)
     
-    def test_filter_overlapping_content_no_overlap(self):
+    def test_filter_overlapping_content_no_overlap(self, pure_detector):
         """Test filtering when there's no overlap."""
         overlap = OverlapResult(False, None, None, None, 0.0)
         
-        result = self.detector.filter_overlapping_content(
-            self.sample_transcript, 
-            self.sample_words, 
+        result = pure_detector.filter_overlapping_content(
+            SAMPLE_TRANSCRIPT, 
+            list(SAMPLE_WORDS), 
             overlap
         )
         
-        self.assertEqual(result.filtered_transcript, self.sample_transcript)
-        self.assertEqual(result.filtered_words, self.sample_words)
-        self.assertEqual(result.removed_duration, 0.0)
+        assert result.filtered_transcript == SAMPLE_TRANSCRIPT
+        assert result.filtered_words == list(SAMPLE_WORDS)
+        assert result.removed_duration == 0.0
     
-    def test_filter_overlapping_content_with_overlap(self):
+    def test_filter_overlapping_content_with_overlap(self, pure_detector):
         """Test filtering when overlap is detected."""
         overlap = OverlapResult(True, 0.0, None, None, 0.8)
         
-        result = self.detector.filter_overlapping_content(
-            self.sample_transcript, 
-            self.sample_words, 
+        result = pure_detector.filter_overlapping_content(
+            SAMPLE_TRANSCRIPT, 
+            list(SAMPLE_WORDS), 
             overlap
         )
         
         # Should remove some content from the beginning
-        self.assertNotEqual(result.filtered_transcript, self.sample_transcript)
-        self.assertLess(len(result.filtered_words), len(self.sample_words))
-        self.assertGreater(result.removed_duration, 0.0)
+        assert result.filtered_transcript != SAMPLE_TRANSCRIPT
+        assert len(result.filtered_words) < len(SAMPLE_WORDS)
+        assert result.removed_duration > 0.0
     
-    def test_calculate_overlap_end_time(self):
+    @pytest.mark.parametrize("similarity_score,expected", [
+        (0.1, 0.5),  # clamped to the 5% floor
+        (0.5, 1.0),  # 20% of the 5s sample
+        (0.8, 1.5),  # clamped to the 30% ceiling
+        (1.0, 1.5),
+    ])
+    def test_calculate_overlap_end_time(self, pure_detector, similarity_score, expected):
         """Test calculation of overlap end time."""
-        similarity_score = 0.8
-        
-        end_time = self.detector._calculate_overlap_end_time(self.sample_words, similarity_score)
+        end_time = pure_detector._calculate_overlap_end_time(list(SAMPLE_WORDS), similarity_score)
         
-        self.assertGreater(end_time, 0.0)
-        self.assertLess(end_time, self.sample_words[-1].end)
+        assert end_time == pytest.approx(expected, abs=1e-6)
     
-    def test_calculate_overlap_end_time_empty_words(self):
+    def test_calculate_overlap_end_time_empty_words(self, pure_detector):
         """Test overlap end time calculation with empty words list."""
-        result = self.detector._calculate_overlap_end_time([], 0.8)
-        self.assertEqual(result, 0.0)
+        result = pure_detector._calculate_overlap_end_time([], 0.8)
+        assert result == 0.0
     
-    def test_save_and_load_transcript_cache(self):
+    def test_save_and_load_transcript_cache(self, detector):
         """Test saving and loading transcript cache."""
         channel = "test_channel"
         transcript = "test transcript content"
         timestamp = datetime.now()
         
         # Save transcript
-        self.detector.save_transcript_cache(channel, transcript, timestamp)
+        detector.save_transcript_cache(channel, transcript, timestamp)
         
         # Verify file was created
-        cache_path = self.detector._get_cache_path(channel)
-        self.assertTrue(os.path.exists(cache_path))
+        cache_path = detector._get_cache_path(channel)
+        assert os.path.exists(cache_path)
         
         # Load transcript
-        loaded_transcript = self.detector.load_previous_transcript(channel)
-        self.assertEqual(loaded_transcript, transcript)
+        loaded_transcript = detector.load_previous_transcript(channel)
+        assert loaded_transcript == transcript
     
-    def test_load_previous_transcript_no_cache(self):
+    def test_load_previous_transcript_no_cache(self, detector):
         """Test loading transcript when no cache exists."""
-        result = self.detector.load_previous_transcript("nonexistent_channel")
-        self.assertIsNone(result)
+        result = detector.load_previous_transcript("nonexistent_channel")
+        assert result is None
     
-    def test_save_transcript_cache_invalid_path(self):
-        """Test saving transcript cache with invalid path."""
-        # Test that initialization fails gracefully with invalid path
-        with self.assertRaises(PermissionError):
-            OverlapDetector(cache_dir="C:\\Windows\\System32\\invalid_cache")
-        
-        # Test error handling during save operation
-        # Create a detector with a valid path first
-        detector = OverlapDetector(cache_dir=self.temp_dir)
-        
+    def test_save_transcript_cache_invalid_path(self, detector, caplog):
+        """Test that a failed cache write is handled instead of raised."""
         # Mock the open function to raise an exception
         with patch('builtins.open', side_effect=PermissionError("Access denied")):
-            with patch('src.overlap_detector.logger') as mock_logger:
+            with caplog.at_level("ERROR"):
                 detector.save_transcript_cache("test", "transcript", datetime.now())
-                mock_logger.error.assert_called()
+        
+        assert any(
+            r.levelname == "ERROR" and "FileOperationError" in r.getMessage()
+            for r in caplog.records
+        )
     
-    def test_load_transcript_cache_corrupted_file(self):
+    def test_load_transcript_cache_corrupted_file(self, detector, caplog):
         """Test loading transcript cache with corrupted JSON."""
         channel = "test_channel"
-        cache_path = self.detector._get_cache_path(channel)
+        cache_path = detector._get_cache_path(channel)
         
         # Create corrupted JSON file
-        with open(cache_path, 'w') as f:
-            f.write("invalid json content")
+        Path(cache_path).write_text("invalid json content")
+        
+        with caplog.at_level("ERROR"):
+            result = detector.load_previous_transcript(channel)
         
-        with patch('src.overlap_detector.logger') as mock_logger:
-            result = self.detector.load_previous_transcript(channel)
-            self.assertIsNone(result)
-            mock_logger.error.assert_called()
+        assert result is None
+        assert any(
+            r.levelname == "ERROR" and "FileOperationError" in r.getMessage()
+            for r in caplog.records
+        )
     
-    def test_process_with_overlap_detection_no_previous(self):
+    def test_process_with_overlap_detection_no_previous(self, detector, transcription_result):
         """Test complete processing workflow with no previous transcript."""
         channel = "test_channel"
-        transcription_result = TranscriptionResult(
-            transcript=self.sample_transcript,
-            words=self.sample_words,
-            confidence=0.9,
-            duration=5.0
-        )
         timestamp = datetime.now()
         
-        filtered_content, overlap_result = self.detector.process_with_overlap_detection(
+        filtered_content, overlap_result = detector.process_with_overlap_detection(
             channel, transcription_result, timestamp
         )
         
         # No overlap expected since no previous transcript
-        self.assertFalse(overlap_result.has_overlap)
-        self.assertEqual(filtered_content.filtered_transcript, self.sample_transcript)
-        self.assertEqual(filtered_content.removed_duration, 0.0)
+        assert not overlap_result.has_overlap
+        assert filtered_content.filtered_transcript == SAMPLE_TRANSCRIPT
+        assert filtered_content.removed_duration == 0.0
         
         # Verify transcript was cached
-        cached = self.detector.load_previous_transcript(channel)
-        self.assertEqual(cached, self.sample_transcript)
+        cached = detector.load_previous_transcript(channel)
+        assert cached == SAMPLE_TRANSCRIPT
     
-    def test_process_with_overlap_detection_with_previous(self):
+    def test_process_with_overlap_detection_with_previous(self, detector, transcription_result):
         """Test complete processing workflow with previous transcript."""
         channel = "test_channel"
         
         # First, save a previous transcript
         previous_transcript = "programa anterior buenos días queridos televidentes"
-        self.detector.save_transcript_cache(channel, previous_transcript, datetime.now())
+        detector.save_transcript_cache(channel, previous_transcript, datetime.now())
         
         # Now process current transcript that overlaps
-        current_transcript = "buenos días queridos televidentes hoy tenemos noticias importantes"
-        current_words = [
-            Word("buenos", 0.0, 0.5, 0.9),
-            Word("días", 0.5, 1.0, 0.9),
-            Word("queridos", 1.0, 1.5, 0.8),
-            Word("televidentes", 1.5, 2.5, 0.9),
-            Word("hoy", 2.5, 3.0, 0.9),
-            Word("tenemos", 3.0, 3.5, 0.8),
-            Word("noticias", 3.5, 4.0, 0.9),
-            Word("importantes", 4.0, 5.0, 0.8)
-        ]
-        
-        transcription_result = TranscriptionResult(
-            transcript=current_transcript,
-            words=current_words,
-            confidence=0.9,
-            duration=5.0
-        )
-        
-        filtered_content, overlap_result = self.detector.process_with_overlap_detection(
+        filtered_content, overlap_result = detector.process_with_overlap_detection(
             channel, transcription_result, datetime.now()
         )
         
         # Should detect overlap
-        self.assertTrue(overlap_result.has_overlap)
-        self.assertGreater(overlap_result.similarity_score, 0.7)
+        assert overlap_result.has_overlap
+        assert overlap_result.similarity_score > 0.7
         
         # Should filter some content
-        self.assertLess(len(filtered_content.filtered_words), len(current_words))
-        self.assertGreater(filtered_content.removed_duration, 0.0)
+        assert len(filtered_content.filtered_words) < len(SAMPLE_WORDS)
+        assert filtered_content.removed_duration > 0.0
     
-    def test_get_cache_path(self):
+    def test_get_cache_path(self, detector, tmp_path):
         """Test cache path generation."""
         channel = "test_channel"
-        expected_path = os.path.join(self.temp_dir, "test_channel_last_transcript.json")
+        expected_path = os.path.join(str(tmp_path), "test_channel_last_transcript.json")
         
-        result = self.detector._get_cache_path(channel)
-        self.assertEqual(result, expected_path)
+        result = detector._get_cache_path(channel)
+        assert result == expected_path
     
-    def test_edge_case_empty_transcripts(self):
+    def test_edge_case_empty_transcripts(self, pure_detector):
         """Test edge case with empty transcripts."""
-        result = self.detector.detect_overlap("", "")
+        result = pure_detector.detect_overlap("", "")
         
-        self.assertFalse(result.has_overlap)
-        self.assertEqual(result.similarity_score, 0.0)
+        assert not result.has_overlap
+        assert result.similarity_score == 0.0
     
-    def test_edge_case_very_short_transcripts(self):
+    def test_edge_case_very_short_transcripts(self, pure_detector):
         """Test edge case with very short transcripts."""
         current = "hola"
         previous = "adiós"
         
-        result = self.detector.detect_overlap(current, previous)
+        result = pure_detector.detect_overlap(current, previous)
         
-        self.assertFalse(result.has_overlap)
+        assert not result.has_overlap
     
-    def test_similarity_threshold(self):
+    def test_similarity_threshold(self, pure_detector):
         """Test that similarity threshold is properly applied."""
-        # Create transcripts with moderate similarity (below threshold)
+        # Create transcripts with moderate similarity
         current = "buenos días queridos amigos"
         previous = "buenos días estimados televidentes"
         
-        result = self.detector.detect_overlap(current, previous)
+        result = pure_detector.detect_overlap(current, previous)
         
-        # Should have some similarity but not enough for overlap detection
-        self.assertGreater(result.similarity_score, 0.0)
-        # Depending on the exact similarity, this might or might not trigger overlap
-        # The test verifies the threshold logic is working
-
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+        # Best window scores just above the 0.7 threshold
+        assert result.similarity_score == pytest.approx(0.829268, abs=1e-6)
+        assert result.has_overlap
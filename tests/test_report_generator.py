@@ -1,64 +1,124 @@
 """
 Unit tests for report_generator module.
 """
-import json
 import os
-import tempfile
+from collections import namedtuple
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import pytest
-import pandas as pd
-from openpyxl import load_workbook
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    from json import loads as _loads
 
 from src.report_generator import ReportGenerator, create_sample_report
 from src.models import CortinillaResult, AccumulatedResults, Occurrence
 
 
+def _assert_channel_json(json_path, channel, hours=None, n_results=None):
+    """Assert the header of a channel JSON report and return the parsed data."""
+    assert json_path.exists()
+    data = _loads(json_path.read_bytes())
+    assert data["channel"] == channel
+    if hours is not None:
+        assert data["total_hours_processed"] == hours
+    if n_results is not None:
+        assert len(data["results"]) == n_results
+    return data
+
+
+ReportPaths = namedtuple("ReportPaths", ["json", "xlsx"])
+
+
+def _report_paths(data_dir, channel="TestChannel"):
+    """Return channel's JSON and Excel report paths under data_dir."""
+    return ReportPaths(
+        json=Path(data_dir) / f"{channel}_results.json",
+        xlsx=Path(data_dir) / f"{channel}_results.xlsx",
+    )
+
+
+@pytest.fixture(scope="class")
+def temp_dir(tmp_path_factory):
+    """Create a temporary directory shared by the class under pytest's basetemp."""
+    return str(tmp_path_factory.mktemp("reports"))
+
+
+@pytest.fixture(scope="class")
+def report_generator(temp_dir):
+    """Create a ReportGenerator shared by tests that do not write reports."""
+    return ReportGenerator(temp_dir)
+
+
+@pytest.fixture
+def fresh_report_generator(tmp_path):
+    """Create a ReportGenerator with its own directory for tests that write reports."""
+    return ReportGenerator(str(tmp_path))
+
+
+@pytest.fixture(scope="class")
+def report_paths(temp_dir):
+    """Report paths of the sample channel in report_generator's directory."""
+    return _report_paths(temp_dir)
+
+
+@pytest.fixture
+def fresh_report_paths(tmp_path):
+    """Report paths of the sample channel in fresh_report_generator's directory."""
+    return _report_paths(tmp_path)
+
+
+@pytest.fixture(scope="module")
+def sample_cortinilla_result():
+    """Create sample CortinillaResult for testing; tests only read it."""
+    occurrences = {
+        "buenos días": [
+            Occurrence(start_time=120.5, end_time=122.3, confidence=0.95, text="buenos días"),
+            Occurrence(start_time=1800.2, end_time=1802.1, confidence=0.92, text="buenos días")
+        ],
+        "buenas tardes": [
+            Occurrence(start_time=900.1, end_time=901.8, confidence=0.88, text="buenas tardes")
+        ]
+    }
+
+    cortinillas_by_type = {
+        "buenos días": 2,
+        "buenas tardes": 1
+    }
+
+    return CortinillaResult(
+        channel="TestChannel",
+        timestamp=datetime(2024, 1, 15, 14, 0, 0),
+        audio_duration=3600.0,
+        total_cortinillas=3,
+        cortinillas_by_type=cortinillas_by_type,
+        cortinillas_details=occurrences,
+        overlap_filtered=False,
+        overlap_duration=None
+    )
+
+
+@pytest.fixture(scope="class")
+def prewritten_report(report_generator, sample_cortinilla_result):
+    """Write the sample result's JSON report once for read-only tests."""
+    report_generator.update_json_report(sample_cortinilla_result)
+    return report_generator
+
+
+@pytest.fixture(scope="class")
+def prewritten_excel_report(prewritten_report, sample_cortinilla_result):
+    """Write the sample result's Excel report once on top of the JSON report."""
+    prewritten_report.update_excel_report(sample_cortinilla_result)
+    return prewritten_report
+
+
 class TestReportGenerator:
     """Test cases for ReportGenerator class."""
     
-    @pytest.fixture
-    def temp_dir(self):
-        """Create temporary directory for testing."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield temp_dir
-    
-    @pytest.fixture
-    def report_generator(self, temp_dir):
-        """Create ReportGenerator instance with temporary directory."""
-        return ReportGenerator(temp_dir)
-    
-    @pytest.fixture
-    def sample_cortinilla_result(self):
-        """Create sample CortinillaResult for testing."""
-        occurrences = {
-            "buenos días": [
-                Occurrence(start_time=120.5, end_time=122.3, confidence=0.95, text="buenos días"),
-                Occurrence(start_time=1800.2, end_time=1802.1, confidence=0.92, text="buenos días")
-            ],
-            "buenas tardes": [
-                Occurrence(start_time=900.1, end_time=901.8, confidence=0.88, text="buenas tardes")
-            ]
-        }
-        
-        cortinillas_by_type = {
-            "buenos días": 2,
-            "buenas tardes": 1
-        }
-        
-        return CortinillaResult(
-            channel="TestChannel",
-            timestamp=datetime(2024, 1, 15, 14, 0, 0),
-            audio_duration=3600.0,
-            total_cortinillas=3,
-            cortinillas_by_type=cortinillas_by_type,
-            cortinillas_details=occurrences,
-            overlap_filtered=False,
-            overlap_duration=None
-        )
-    
     def test_init_creates_data_directory(self, temp_dir):
         """Test that ReportGenerator creates data directory if it doesn't exist."""
         data_dir = Path(temp_dir) / "test_data"
@@ -68,25 +128,19 @@ class TestReportGenerator:
         assert data_dir.exists()
         assert data_dir.is_dir()
     
-    def test_update_json_report_creates_new_file(self, report_generator, sample_cortinilla_result):
+    def test_update_json_report_creates_new_file(self, fresh_report_generator, fresh_report_paths,
+                                                 sample_cortinilla_result):
         """Test creating new JSON report file."""
-        report_generator.update_json_report(sample_cortinilla_result)
+        fresh_report_generator.update_json_report(sample_cortinilla_result)
         
-        json_path = Path(report_generator.data_dir) / "TestChannel_results.json"
-        assert json_path.exists()
-        
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        assert data["channel"] == "TestChannel"
-        assert data["total_hours_processed"] == 1
-        assert len(data["results"]) == 1
+        data = _assert_channel_json(fresh_report_paths.json, "TestChannel", hours=1, n_results=1)
         assert data["results"][0]["total_cortinillas"] == 3
     
-    def test_update_json_report_appends_to_existing(self, report_generator, sample_cortinilla_result):
+    def test_update_json_report_appends_to_existing(self, fresh_report_generator, fresh_report_paths,
+                                                    sample_cortinilla_result):
         """Test appending to existing JSON report file."""
         # Create first result
-        report_generator.update_json_report(sample_cortinilla_result)
+        fresh_report_generator.update_json_report(sample_cortinilla_result)
         
         # Create second result
         second_result = CortinillaResult(
@@ -103,48 +157,48 @@ class TestReportGenerator:
             overlap_duration=30.0
         )
         
-        report_generator.update_json_report(second_result)
+        fresh_report_generator.update_json_report(second_result)
         
-        json_path = Path(report_generator.data_dir) / "TestChannel_results.json"
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _loads(fresh_report_paths.json.read_bytes())
+        results = data["results"]
         
         assert data["total_hours_processed"] == 2
-        assert len(data["results"]) == 2
-        assert data["results"][1]["overlap_filtered"] is True
-        assert data["results"][1]["overlap_duration"] == 30.0
+        assert len(results) == 2
+        assert results[1]["overlap_filtered"] is True
+        assert results[1]["overlap_duration"] == 30.0
     
-    def test_update_excel_report_creates_workbook(self, report_generator, sample_cortinilla_result):
+    @pytest.mark.xlsx
+    def test_update_excel_report_creates_workbook(self, prewritten_excel_report, report_paths):
         """Test creating Excel report with multiple sheets."""
-        report_generator.update_excel_report(sample_cortinilla_result)
-        
-        excel_path = Path(report_generator.data_dir) / "TestChannel_results.xlsx"
+        excel_path = report_paths.xlsx
         assert excel_path.exists()
         
         # Load workbook and check sheets
-        wb = load_workbook(excel_path)
-        expected_sheets = ["Resumen", "Detalles por Hora", "Desglose Cortinillas"]
-        assert all(sheet in wb.sheetnames for sheet in expected_sheets)
-        
-        # Check summary sheet content
-        summary_ws = wb["Resumen"]
-        assert summary_ws["A1"].value == "Métrica"
-        assert summary_ws["B1"].value == "Valor"
-        assert summary_ws["B2"].value == "TestChannel"  # Channel name
-        assert summary_ws["B3"].value == 1  # Total hours processed
+        from openpyxl import load_workbook
+        wb = load_workbook(excel_path, read_only=True, data_only=True)
+        try:
+            expected_sheets = ["Resumen", "Detalles por Hora", "Desglose Cortinillas"]
+            assert all(sheet in wb.sheetnames for sheet in expected_sheets)
+            
+            # Check summary sheet content
+            summary_ws = wb["Resumen"]
+            assert summary_ws["A1"].value == "Métrica"
+            assert summary_ws["B1"].value == "Valor"
+            assert summary_ws["B2"].value == "TestChannel"  # Channel name
+            assert summary_ws["B3"].value == 1  # Total hours processed
+        finally:
+            wb.close()
     
     def test_load_existing_results_returns_none_for_nonexistent(self, report_generator):
         """Test loading results when file doesn't exist."""
         result = report_generator.load_existing_results("NonExistentChannel")
         assert result is None
     
-    def test_load_existing_results_loads_valid_data(self, report_generator, sample_cortinilla_result):
+    def test_load_existing_results_loads_valid_data(self, fresh_report_generator, sample_cortinilla_result):
         """Test loading existing results from JSON file."""
-        # First create a report
-        report_generator.update_json_report(sample_cortinilla_result)
+        fresh_report_generator.update_json_report(sample_cortinilla_result)
         
-        # Then load it
-        accumulated = report_generator.load_existing_results("TestChannel")
+        accumulated = fresh_report_generator.load_existing_results("TestChannel")
         
         assert accumulated is not None
         assert accumulated.channel == "TestChannel"
@@ -166,11 +220,9 @@ class TestReportGenerator:
         
         assert summary == expected
     
-    def test_get_channel_summary_with_data(self, report_generator, sample_cortinilla_result):
+    def test_get_channel_summary_with_data(self, prewritten_report):
         """Test getting summary for channel with data."""
-        report_generator.update_json_report(sample_cortinilla_result)
-        
-        summary = report_generator.get_channel_summary("TestChannel")
+        summary = prewritten_report.get_channel_summary("TestChannel")
         
         assert summary["channel"] == "TestChannel"
         assert summary["total_hours"] == 1
@@ -204,11 +256,12 @@ class TestReportGenerator:
                 assert occ.confidence == orig_occ.confidence
                 assert occ.text == orig_occ.text
     
-    def test_excel_formatting_applied(self, report_generator, sample_cortinilla_result):
+    @pytest.mark.xlsx
+    def test_excel_formatting_applied(self, prewritten_excel_report, report_paths):
         """Test that Excel formatting is properly applied."""
-        report_generator.update_excel_report(sample_cortinilla_result)
-        
-        excel_path = Path(report_generator.data_dir) / "TestChannel_results.xlsx"
+        excel_path = report_paths.xlsx
+        # Formatting checks read styles, so use a full (not read-only) load
+        from openpyxl import load_workbook
         wb = load_workbook(excel_path)
         
         # Check header formatting in summary sheet
@@ -227,7 +280,7 @@ class TestReportGenerator:
         for i, expected_header in enumerate(expected_headers, 1):
             assert details_ws.cell(row=1, column=i).value == expected_header
     
-    def test_multiple_channels_separate_files(self, report_generator):
+    def test_multiple_channels_separate_files(self, fresh_report_generator):
         """Test that different channels create separate files."""
         # Create results for two different channels
         result1 = CortinillaResult(
@@ -252,24 +305,16 @@ class TestReportGenerator:
             overlap_duration=None
         )
         
-        report_generator.update_json_report(result1)
-        report_generator.update_json_report(result2)
+        fresh_report_generator.update_json_report(result1)
+        fresh_report_generator.update_json_report(result2)
         
         # Check that separate files were created
-        json_path1 = Path(report_generator.data_dir) / "Channel1_results.json"
-        json_path2 = Path(report_generator.data_dir) / "Channel2_results.json"
-        
-        assert json_path1.exists()
-        assert json_path2.exists()
+        json_path1 = _report_paths(fresh_report_generator.data_dir, "Channel1").json
+        json_path2 = _report_paths(fresh_report_generator.data_dir, "Channel2").json
         
         # Verify content is separate
-        with open(json_path1, 'r', encoding='utf-8') as f:
-            data1 = json.load(f)
-        with open(json_path2, 'r', encoding='utf-8') as f:
-            data2 = json.load(f)
-        
-        assert data1["channel"] == "Channel1"
-        assert data2["channel"] == "Channel2"
+        data1 = _assert_channel_json(json_path1, "Channel1")
+        data2 = _assert_channel_json(json_path2, "Channel2")
         
         # Check the actual keys in cortinillas_by_type
         cortinillas1 = data1["results"][0]["cortinillas_by_type"]
@@ -280,24 +325,28 @@ class TestReportGenerator:
         assert "buenas tardes" in cortinillas2
         assert cortinillas2["buenas tardes"] == 1
     
-    @patch('src.report_generator.logger')
-    @patch('builtins.open', side_effect=PermissionError("Permission denied"))
-    def test_error_handling_json_update(self, mock_open, mock_logger, report_generator, sample_cortinilla_result):
+    def test_error_handling_json_update(self, fresh_report_generator, sample_cortinilla_result):
         """Test error handling during JSON update."""
-        with pytest.raises(PermissionError):
-            report_generator.update_json_report(sample_cortinilla_result)
+        with patch('src.report_generator.open', create=True,
+                   side_effect=PermissionError("Permission denied")), \
+                patch('src.report_generator.logger') as mock_logger:
+            with pytest.raises(PermissionError):
+                fresh_report_generator.update_json_report(sample_cortinilla_result)
         
         # Verify error was logged
         mock_logger.error.assert_called()
         error_call = mock_logger.error.call_args[0][0]
         assert "Error updating JSON report" in error_call
     
+    @patch('src.report_generator.load_workbook', autospec=True)
+    @patch('src.report_generator.Workbook', autospec=True)
     @patch('src.report_generator.logger')
     @patch('src.report_generator.ReportGenerator.load_existing_results', side_effect=IOError("Disk full"))
-    def test_error_handling_excel_update(self, mock_load, mock_logger, report_generator, sample_cortinilla_result):
-        """Test error handling during Excel update."""
+    def test_error_handling_excel_update(self, mock_load, mock_logger, mock_workbook, mock_load_workbook,
+                                         fresh_report_generator, sample_cortinilla_result):
+        """Test error handling during Excel update; no real workbook is built."""
         with pytest.raises(IOError):
-            report_generator.update_excel_report(sample_cortinilla_result)
+            fresh_report_generator.update_excel_report(sample_cortinilla_result)
         
         # Verify error was logged
         mock_logger.error.assert_called()
@@ -308,32 +357,30 @@ class TestReportGenerator:
 class TestCreateSampleReport:
     """Test cases for create_sample_report function."""
     
+    @pytest.mark.xlsx
     def test_create_sample_report(self, tmp_path):
         """Test creating sample reports."""
         data_dir = str(tmp_path)
         
         create_sample_report("TestChannel", data_dir)
         
-        # Check that files were created
+        # Check that the JSON file was created
         json_path = tmp_path / "TestChannel_results.json"
-        excel_path = tmp_path / "TestChannel_results.xlsx"
+        _assert_channel_json(json_path, "TestChannel", hours=3, n_results=3)
         
-        assert json_path.exists()
+        # Check that the Excel file was created
+        excel_path = tmp_path / "TestChannel_results.xlsx"
         assert excel_path.exists()
         
-        # Verify JSON content
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        assert data["channel"] == "TestChannel"
-        assert data["total_hours_processed"] == 3
-        assert len(data["results"]) == 3
-        
         # Verify Excel content
-        wb = load_workbook(excel_path)
-        assert "Resumen" in wb.sheetnames
-        assert "Detalles por Hora" in wb.sheetnames
-        assert "Desglose Cortinillas" in wb.sheetnames
+        from openpyxl import load_workbook
+        wb = load_workbook(excel_path, read_only=True)
+        try:
+            assert "Resumen" in wb.sheetnames
+            assert "Detalles por Hora" in wb.sheetnames
+            assert "Desglose Cortinillas" in wb.sheetnames
+        finally:
+            wb.close()
 
 
 if __name__ == "__main__":